@@ -1,12 +1,32 @@
 """Display helpers: formatting, colors, and ASCII art for the quiz game."""
 
+import atexit
+import io
+import re
 import sys
 import os
 import time
 
-# Enable ANSI on Windows
+# Enable ANSI on Windows (ENABLE_VIRTUAL_TERMINAL_PROCESSING on the
+# stdout console handle; no-op if stdout isn't a console).
 if os.name == "nt":
-    os.system("")
+    import ctypes
+    _kernel32 = ctypes.windll.kernel32
+    _handle = _kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    _mode = ctypes.c_ulong()
+    if _kernel32.GetConsoleMode(_handle, ctypes.byref(_mode)):
+        _kernel32.SetConsoleMode(_handle, _mode.value | 0x0004)
+
+# QUIZ_FAST=1 skips the timed animations (countdown, spinners, the
+# typewriter effect) for power users and scripted runs.
+_FAST = os.environ.get("QUIZ_FAST") == "1"
+
+# When stdout is piped or redirected, colors are wasted bytes and
+# animations just burn wall-clock time: blank the ANSI constants below
+# and run as if QUIZ_FAST were set.
+_TTY = sys.stdout.isatty()
+if not _TTY:
+    _FAST = True
 
 # ANSI color codes
 RESET = "\033[0m"
@@ -36,31 +56,106 @@ BG_MAGENTA = "\033[45m"
 BG_CYAN = "\033[46m"
 BG_WHITE = "\033[47m"
 
+if not _TTY:
+    RESET = BOLD = DIM = ITALIC = UNDERLINE = BLINK = ""
+    BLACK = RED = GREEN = YELLOW = BLUE = MAGENTA = CYAN = WHITE = ""
+    BG_BLACK = BG_RED = BG_GREEN = BG_YELLOW = ""
+    BG_BLUE = BG_MAGENTA = BG_CYAN = BG_WHITE = ""
+
+# Matches any SGR escape sequence; used to measure visible text width.
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+# Constant ANSI runs for menu/choice rows, pre-encoded to bytes once so
+# the row loops only encode the user-supplied text.
+_MENU_NUM_PREFIX_B = f"      {YELLOW}{BOLD}[".encode()
+_MENU_NUM_MID_B = f"]{RESET} {WHITE}".encode()
+_MENU_BULLET_PREFIX_B = f"      {CYAN}>{RESET} {WHITE}".encode()
+_CHOICE_PREFIX_B = f"        {YELLOW}{BOLD}[".encode()
+_CHOICE_MID_B = f"]{RESET} ".encode()
+_CHOICE_DOT_B = f". {WHITE}".encode()
+_ROW_END_B = f"{RESET}\n".encode()
+
+# Choice letter labels, indexed instead of computed via chr() per row.
+_LETTERS = "ABCDEFGHIJKLMNOP"
+
+
+# Buffered stdout writer: helpers append lines here and the buffer is
+# flushed only at input boundaries (get_input) or when animation timing
+# demands it, instead of one write+flush syscall per line.
+_OUT = io.BufferedWriter(sys.stdout.buffer, buffer_size=1 << 14)
+
+
+def flush():
+    """Flush the buffered output all the way to the terminal.
+
+    sys.stdout.buffer is itself block-buffered, so it must be flushed
+    too; nothing else does it now that input() is out of the picture.
+    """
+    _OUT.flush()
+    sys.stdout.buffer.flush()
+
+
+# Whatever is still buffered must reach the terminal when the process
+# exits, even on an unexpected path that never hits an input boundary.
+atexit.register(flush)
+
+
+class ScreenBuffer:
+    """Marks a screen's worth of output as one unit.
+
+    Helper output already coalesces in the shared BufferedWriter; the
+    context manager makes the screen boundary explicit and emits the
+    accumulated block with a single flush on exit, instead of leaving
+    it to sit until the next input prompt.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        flush()
+        return False
+
 
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if not _TTY:
+        return
+    # ED + cursor-home escape; ANSI is enabled on Windows at import, so
+    # no need to shell out to cls/clear.
+    _OUT.write(b"\x1b[2J\x1b[H")
 
 
 def _print(text: str):
     """Print with utf-8 encoding support."""
-    sys.stdout.buffer.write((text + "\n").encode("utf-8"))
-    sys.stdout.flush()
+    _OUT.write((text + "\n").encode("utf-8"))
 
 
 def slow_print(text: str, delay: float = 0.02):
     """Print text character by character for effect."""
-    for char in text:
-        sys.stdout.buffer.write(char.encode("utf-8"))
+    if _FAST or delay <= 0:
+        _print(text)
+        return
+    flush()
+    # Encode once up front so the timing loop is just write+flush+sleep.
+    # For ASCII text one byte is one character, so slice the encoded
+    # buffer directly instead of encoding per character.
+    data = text.encode("utf-8")
+    if text.isascii():
+        encoded = [data[i:i + 1] for i in range(len(data))]
+    else:
+        encoded = [char.encode("utf-8") for char in text]
+    for chunk in encoded:
+        sys.stdout.buffer.write(chunk)
         sys.stdout.flush()
         time.sleep(delay)
-    print()
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.flush()
 
 
-def banner():
-    """Print the quiz game banner with ASCII art."""
-    clear_screen()
-    art = f"""
+# Parameter-free art blocks are invariant, so render and encode them
+# once at import time (trailing newline matches what _print would add).
+_BANNER_B = f"""
 {CYAN}{BOLD}
     +==============================================================+
     |                                                              |
@@ -74,31 +169,47 @@ def banner():
 {RESET}
 {DIM}                    Test Your Knowledge Across 6 Categories!{RESET}
 {DIM}                       360 Questions | 3 Difficulty Levels{RESET}
-"""
-    _print(art)
+""".encode("utf-8") + b"\n"
+
+
+def banner():
+    """Print the quiz game banner with ASCII art."""
+    clear_screen()
+    _OUT.write(_BANNER_B)
 
 
 def print_box(title: str, content: list[str] = None, width: int = 50):
     """Print content in a stylized box."""
-    _print(f"\n{CYAN}    +{'=' * (width - 2)}+{RESET}")
-    _print(f"{CYAN}    |{BOLD}{WHITE} {title.center(width - 4)} {RESET}{CYAN}|{RESET}")
-    _print(f"{CYAN}    +{'-' * (width - 2)}+{RESET}")
+    buf = [
+        f"\n{CYAN}    +{'=' * (width - 2)}+{RESET}",
+        f"{CYAN}    |{BOLD}{WHITE} {title.center(width - 4)} {RESET}{CYAN}|{RESET}",
+        f"{CYAN}    +{'-' * (width - 2)}+{RESET}",
+    ]
     if content:
         for line in content:
-            padding = width - 4 - len(line.replace(YELLOW, '').replace(RESET, '').replace(GREEN, '').replace(RED, '').replace(CYAN, '').replace(BOLD, '').replace(MAGENTA, ''))
-            _print(f"{CYAN}    |{RESET} {line}{' ' * max(0, padding)} {CYAN}|{RESET}")
-        _print(f"{CYAN}    +{'=' * (width - 2)}+{RESET}")
-    print()
+            visible = _ANSI_RE.sub('', line) if '\x1b' in line else line
+            # ljust via format spec: pads in place, no separate space string
+            span = len(line) + max(0, width - 4 - len(visible))
+            buf.append(f"{CYAN}    |{RESET} {line:<{span}} {CYAN}|{RESET}")
+        buf.append(f"{CYAN}    +{'=' * (width - 2)}+{RESET}")
+    buf.append("")
+    _print("\n".join(buf))
 
 
 def print_menu(options: list[str], numbered: bool = True):
     """Print a styled numbered menu."""
+    buf = bytearray()
     for i, option in enumerate(options, 1):
         if numbered:
-            _print(f"      {YELLOW}{BOLD}[{i}]{RESET} {WHITE}{option}{RESET}")
+            buf += _MENU_NUM_PREFIX_B
+            buf += str(i).encode()
+            buf += _MENU_NUM_MID_B
         else:
-            _print(f"      {CYAN}>{RESET} {WHITE}{option}{RESET}")
-    print()
+            buf += _MENU_BULLET_PREFIX_B
+        buf += option.encode("utf-8")
+        buf += _ROW_END_B
+    buf += b"\n"
+    _OUT.write(buf)
 
 
 def print_question_box(question_num: int, total: int, text: str, difficulty: str):
@@ -109,23 +220,28 @@ def print_question_box(question_num: int, total: int, text: str, difficulty: str
         "hard": RED
     }.get(difficulty, WHITE)
 
-    _print(f"\n{MAGENTA}    {'*' * 56}{RESET}")
-    _print(f"{MAGENTA}    *{RESET}  {BOLD}Question {question_num}/{total}{RESET}                    {diff_color}[{difficulty.upper()}]{RESET}  {MAGENTA}*{RESET}")
-    _print(f"{MAGENTA}    {'*' * 56}{RESET}")
-    _print(f"\n      {CYAN}{BOLD}{text}{RESET}\n")
+    _print(f"\n{MAGENTA}    {'*' * 56}{RESET}\n"
+           f"{MAGENTA}    *{RESET}  {BOLD}Question {question_num}/{total}{RESET}                    {diff_color}[{difficulty.upper()}]{RESET}  {MAGENTA}*{RESET}\n"
+           f"{MAGENTA}    {'*' * 56}{RESET}\n"
+           f"\n      {CYAN}{BOLD}{text}{RESET}\n")
 
 
 def print_choices(choices: list[str]):
     """Print answer choices in a grid."""
+    buf = bytearray()
     for i, choice in enumerate(choices):
-        letter = chr(65 + i)  # A, B, C, D
-        _print(f"        {YELLOW}{BOLD}[{i + 1}]{RESET} {letter}. {WHITE}{choice}{RESET}")
-    print()
-
-
-def print_correct():
-    """Print correct answer feedback."""
-    art = f"""
+        buf += _CHOICE_PREFIX_B
+        buf += str(i + 1).encode()
+        buf += _CHOICE_MID_B
+        buf += _LETTERS[i].encode()  # A, B, C, D
+        buf += _CHOICE_DOT_B
+        buf += choice.encode("utf-8")
+        buf += _ROW_END_B
+    buf += b"\n"
+    _OUT.write(buf)
+
+
+_CORRECT_ART_B = f"""
     {GREEN}{BOLD}
      ██████╗ ██████╗ ██████╗ ██████╗ ███████╗ ██████╗████████╗██╗
     ██╔════╝██╔═══██╗██╔══██╗██╔══██╗██╔════╝██╔════╝╚══██╔══╝██║
@@ -133,13 +249,9 @@ def print_correct():
     ██║     ██║   ██║██╔══██╗██╔══██╗██╔══╝  ██║        ██║   ╚═╝
     ╚██████╗╚██████╔╝██║  ██║██║  ██║███████╗╚██████╗   ██║   ██╗
      ╚═════╝ ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝ ╚═════╝   ╚═╝   ╚═╝
-    {RESET}"""
-    _print(art)
-
+    {RESET}""".encode("utf-8") + b"\n"
 
-def print_wrong(correct_answer: str):
-    """Print wrong answer feedback."""
-    art = f"""
+_WRONG_ART_B = f"""
     {RED}{BOLD}
     ██╗    ██╗██████╗  ██████╗ ███╗   ██╗ ██████╗ ██╗
     ██║    ██║██╔══██╗██╔═══██╗████╗  ██║██╔════╝ ██║
@@ -147,10 +259,22 @@ def print_wrong(correct_answer: str):
     ██║███╗██║██╔══██╗██║   ██║██║╚██╗██║██║   ██║╚═╝
     ╚███╔███╔╝██║  ██║╚██████╔╝██║ ╚████║╚██████╔╝██╗
      ╚══╝╚══╝ ╚═╝  ╚═╝ ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝ ╚═╝
-    {RESET}
-      {DIM}The correct answer was: {CYAN}{correct_answer}{RESET}
-"""
-    _print(art)
+    {RESET}""".encode("utf-8")
+
+
+def print_correct():
+    """Print correct answer feedback."""
+    _OUT.write(_CORRECT_ART_B)
+
+
+def print_wrong(correct_answer: str):
+    """Print wrong answer feedback."""
+    _OUT.write(_WRONG_ART_B)
+    _print(f"\n      {DIM}The correct answer was: {CYAN}{correct_answer}{RESET}\n")
+
+
+# All 21 possible fill states of the 20-cell score bar, built once.
+_BARS = [f"{GREEN}{'█' * p}{DIM}{'░' * (20 - p)}{RESET}" for p in range(21)]
 
 
 def print_score_bar(current: int, total: int, points: int, streak: int):
@@ -160,17 +284,20 @@ def print_score_bar(current: int, total: int, points: int, streak: int):
     else:
         pct = int((current / total) * 20)
 
-    bar = f"{GREEN}{'█' * pct}{DIM}{'░' * (20 - pct)}{RESET}"
+    bar = _BARS[pct]
     streak_display = f"{YELLOW}🔥 x{streak}{RESET}" if streak > 1 else ""
 
     _print(f"\n    {BOLD}Score:{RESET} [{bar}] {current}/{total}  |  {BOLD}Points:{RESET} {CYAN}{points}{RESET}  {streak_display}\n")
 
 
+_HDR_BAR = f"{CYAN}    {'=' * 50}{RESET}"
+
+
 def print_header(text: str):
     """Print a section header."""
-    _print(f"\n{CYAN}    {'=' * 50}{RESET}")
-    _print(f"    {BOLD}{WHITE}{text.center(50)}{RESET}")
-    _print(f"{CYAN}    {'=' * 50}{RESET}\n")
+    _print(f"\n{_HDR_BAR}\n"
+           f"    {BOLD}{WHITE}{text.center(50)}{RESET}\n"
+           f"{_HDR_BAR}\n")
 
 
 def print_results(correct: int, total: int, points: int, streak: int, percentage: float):
@@ -219,13 +346,21 @@ def print_results(correct: int, total: int, points: int, streak: int, percentage
     _print(art)
 
 
+_GO_B = f"\n{GREEN}{BOLD}    GO!{RESET}\n\n".encode()
+
+
 def print_countdown(seconds: int = 3):
     """Print a countdown before starting."""
+    if _FAST:
+        _OUT.write(_GO_B)
+        return
     for i in range(seconds, 0, -1):
         _print(f"\n{BOLD}    Starting in... {CYAN}{i}{RESET}")
+        flush()
         time.sleep(0.5)
         clear_screen()
-    _print(f"\n{GREEN}{BOLD}    GO!{RESET}\n")
+    _OUT.write(_GO_B)
+    flush()
     time.sleep(0.3)
 
 
@@ -237,21 +372,35 @@ def print_timer_warning(seconds_left: int):
 
 def get_input(prompt: str) -> str:
     """Get user input with colored prompt."""
-    return input(f"    {YELLOW}{BOLD}>{RESET} {prompt} ")
+    # Write the prompt through the shared buffer and read the line
+    # directly; builtin input() adds redundant flushes per call.
+    _OUT.write(f"    {YELLOW}{BOLD}>{RESET} {prompt} ".encode("utf-8"))
+    flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError("EOF when reading a line")
+    return line.rstrip("\n")
 
 
 def print_loading(text: str = "Loading", duration: float = 1.0):
     """Print a loading animation."""
+    if _FAST:
+        _print(f"    {GREEN}✓{RESET} {text}... Done!")
+        return
     frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+    # Render all frames to bytes once; the loop is then pure write+sleep.
+    frame_bytes = [f"\r    {CYAN}{f}{RESET} {text}...".encode("utf-8") for f in frames]
+    done_bytes = f"\r    {GREEN}✓{RESET} {text}... Done!\n".encode("utf-8")
+    flush()
     end_time = time.time() + duration
     i = 0
     while time.time() < end_time:
-        sys.stdout.write(f"\r    {CYAN}{frames[i % len(frames)]}{RESET} {text}...")
-        sys.stdout.flush()
+        sys.stdout.buffer.write(frame_bytes[i % len(frame_bytes)])
+        sys.stdout.buffer.flush()
         time.sleep(0.1)
         i += 1
-    sys.stdout.write(f"\r    {GREEN}✓{RESET} {text}... Done!\n")
-    sys.stdout.flush()
+    sys.stdout.buffer.write(done_bytes)
+    sys.stdout.buffer.flush()
 
 
 def print_lives(lives: int, max_lives: int = 3):
@@ -284,6 +433,9 @@ def print_challenge_over(correct: int, points: int, streak: int):
 
 def print_welcome_animation():
     """Print welcome animation."""
+    if _FAST:
+        _print(f"    {CYAN}{BOLD}>>> QUIZ MASTER! <<<{RESET}\n")
+        return
     frames = [
         "Q",
         "QU",
@@ -298,6 +450,7 @@ def print_welcome_animation():
         "QUIZ MASTER",
         "QUIZ MASTER!",
     ]
+    flush()
     for frame in frames:
         sys.stdout.write(f"\r    {CYAN}{BOLD}>>> {frame} <<<{RESET}    ")
         sys.stdout.flush()
@@ -1,38 +1,48 @@
 """Quiz Master - Main game loop and user interface."""
 
+import sys
 import time
+from functools import lru_cache
 from display import (
     banner, print_menu, get_input, print_header, print_correct, print_wrong,
-    _print, clear_screen, print_box, print_question_box, print_choices,
+    _print, flush, clear_screen, print_box, print_question_box, print_choices,
+    ScreenBuffer,
     print_score_bar, print_results, print_countdown, print_loading,
     print_welcome_animation, print_lives, print_challenge_over,
     CYAN, RESET, BOLD, YELLOW, GREEN, RED, MAGENTA, WHITE, DIM
 )
-from questions import (
-    load_questions, get_categories, get_difficulties,
-    filter_questions, pick_questions
-)
-from scoring import ScoreTracker, save_high_score, get_top_scores, save_game_history, load_game_history
+from scoring import ScoreTracker, save_game, get_top_scores, load_game_history
+
+
+@lru_cache(maxsize=16)
+def _make_choice_reader(max_val: int, default: int | None):
+    """Build a reader closure specialized for one (max_val, default).
+
+    Only a handful of bounds occur (3 for difficulty, 8 for the main
+    menu, ...), so each closure is compiled once and reused with the
+    bounds bound as fast locals.
+    """
+    def read(prompt: str) -> int:
+        raw = get_input(prompt).strip()
+        # isdecimal, not isdigit: superscript/circled digits pass
+        # isdigit but blow up int().
+        if raw.isdecimal():
+            val = int(raw)
+            if 1 <= val <= max_val:
+                return val
+        if default is not None:
+            return default
+        return 1
+    return read
 
 
 def get_choice(prompt: str, max_val: int, default: int | None = None) -> int:
     """Get a validated integer choice from 1 to max_val."""
-    raw = get_input(prompt)
-    try:
-        val = int(raw)
-        if 1 <= val <= max_val:
-            return val
-    except ValueError:
-        pass
-    if default is not None:
-        return default
-    return 1
+    return _make_choice_reader(max_val, default)(prompt)
 
 
-def show_help():
-    """Display help and game instructions."""
-    clear_screen()
-    _print(f"""
+# Static screens and per-answer templates, formatted once at import.
+_HELP_TEXT = f"""
 {CYAN}{BOLD}
     ╔═══════════════════════════════════════════════════════╗
     ║                  HOW TO PLAY                          ║
@@ -67,7 +77,32 @@ def show_help():
     {GREEN}Literature{RESET} | {RED}Art{RESET} | {BOLD}Technology{RESET}
 
 {CYAN}{BOLD}    ╚═══════════════════════════════════════════════════════╝{RESET}
-""")
+"""
+
+_POINTS_TMPL = f"    {GREEN}{BOLD}+{{pts}} points{{bonus}}{RESET}"
+
+_DIFF_DISPLAY = [
+    f"{GREEN}Easy{RESET}    - Warm up your brain",
+    f"{YELLOW}Medium{RESET}  - A fair challenge",
+    f"{RED}Hard{RESET}    - For true masters"
+]
+
+# History row color by percentage tier, indexed branchlessly with
+# (pct >= 50) + (pct >= 80).
+_PCT_COLORS = (RED, YELLOW, GREEN)
+
+# Table row templates: one %-format per row instead of concatenating
+# half a dozen f-string fragments per entry.
+_HIST_ROW_FMT = ("    " + DIM + "%-4d" + RESET + "%-18s%-12s%s%s/%s (%s%%)"
+                 + RESET + "  " + CYAN + "%-10d" + RESET + "%s")
+_SCORE_ROW_FMT = ("    %s" + CYAN + "%-4d" + RESET + "%-15s%s/%-8d"
+                  + YELLOW + "%-10d" + RESET + GREEN + "%-10d" + RESET + "%s")
+
+
+def show_help():
+    """Display help and game instructions."""
+    clear_screen()
+    _print(_HELP_TEXT)
     get_input("Press ENTER to go back...")
 
 
@@ -83,9 +118,14 @@ def show_stats():
         return
 
     total_games = len(scores)
-    avg_pct = sum(s["percentage"] for s in scores) / total_games
     best = scores[0]
-    total_points = sum(s.get("points", 0) for s in scores)
+    # One pass over the score dicts instead of two generator sweeps
+    pct_sum = 0.0
+    total_points = 0
+    for s in scores:
+        pct_sum += s["percentage"]
+        total_points += s.get("points", 0)
+    avg_pct = pct_sum / total_games
 
     _print(f"""
 {CYAN}{BOLD}
@@ -110,13 +150,21 @@ def show_stats():
 
 def play_quiz(timed: bool = False):
     """Run a single quiz session."""
+    # Deferred import: questions (and its JSON parse machinery) is only
+    # needed once a game actually starts, not to draw the main menu.
+    from questions import (
+        load_questions, get_categories, get_difficulties,
+        filter_questions, pick_questions, questions_loaded
+    )
+
     clear_screen()
-    print_loading("Loading questions", 0.5)
+    if not questions_loaded():
+        print_loading("Loading questions", 0.5)
 
-    questions = load_questions()
+    bank = load_questions()
 
     # Choose category
-    categories = get_categories(questions)
+    categories = get_categories(bank)
     print_header("SELECT CATEGORY")
     all_options = ["All Categories"] + categories
     print_menu(all_options)
@@ -127,21 +175,17 @@ def play_quiz(timed: bool = False):
     clear_screen()
     print_header("SELECT DIFFICULTY")
     difficulties = get_difficulties()
-    diff_display = [
-        f"{GREEN}Easy{RESET}    - Warm up your brain",
-        f"{YELLOW}Medium{RESET}  - A fair challenge",
-        f"{RED}Hard{RESET}    - For true masters"
-    ]
-    for i, d in enumerate(diff_display, 1):
+    for i, d in enumerate(_DIFF_DISPLAY, 1):
         _print(f"      {YELLOW}{BOLD}[{i}]{RESET} {d}")
-    print()
+    _print("")
     diff_idx = get_choice("Enter your choice:", 3, default=1)
     difficulty = difficulties[diff_idx - 1]
 
     # Filter and pick questions
-    pool = filter_questions(questions, category, difficulty)
+    pool = filter_questions(bank, category, difficulty)
     if not pool:
         _print(f"\n    {RED}No questions match your filters. Try again.{RESET}\n")
+        flush()
         time.sleep(1.5)
         return
 
@@ -167,10 +211,12 @@ def play_quiz(timed: bool = False):
         _print(f"    {BOLD}Mode:{RESET} {RED}TIMED (15s per question){RESET}")
     print_countdown(3)
 
-    # Quiz loop
+    # Quiz loop (hoist loop invariants: question count, bound method)
+    total = len(selected)
+    record = tracker.record
     for i, q in enumerate(selected, 1):
         clear_screen()
-        print_question_box(i, len(selected), q.text, q.difficulty)
+        print_question_box(i, total, q.text, q.difficulty)
         print_choices(q.choices)
 
         if timed:
@@ -188,25 +234,26 @@ def play_quiz(timed: bool = False):
             choice_idx = get_choice("Your answer:", len(q.choices)) - 1
             correct = q.check(choice_idx)
 
-        details = tracker.record(correct, q.difficulty)
-
-        if correct:
-            print_correct()
-            bonus_parts = []
-            if details["difficulty_bonus"]:
-                bonus_parts.append(f"difficulty +{details['difficulty_bonus']}")
-            if details["streak_bonus"]:
-                bonus_parts.append(f"streak x{tracker.streak} +{details['streak_bonus']}")
-            bonus_str = f" ({', '.join(bonus_parts)})" if bonus_parts else ""
-            _print(f"    {GREEN}{BOLD}+{details['points_earned']} points{bonus_str}{RESET}")
-        else:
-            print_wrong(q.correct_answer)
-            if tracker.best_streak > 0:
-                _print(f"    {RED}Streak broken!{RESET}")
+        details = record(correct, q.difficulty)
+
+        with ScreenBuffer():
+            if correct:
+                print_correct()
+                bonus_parts = []
+                if details["difficulty_bonus"]:
+                    bonus_parts.append(f"difficulty +{details['difficulty_bonus']}")
+                if details["streak_bonus"]:
+                    bonus_parts.append(f"streak x{tracker.streak} +{details['streak_bonus']}")
+                bonus_str = f" ({', '.join(bonus_parts)})" if bonus_parts else ""
+                _print(_POINTS_TMPL.format(pts=details['points_earned'], bonus=bonus_str))
+            else:
+                print_wrong(q.correct_answer)
+                if tracker.best_streak > 0:
+                    _print(f"    {RED}Streak broken!{RESET}")
 
-        print_score_bar(tracker.correct, tracker.total, tracker.points, tracker.streak)
+            print_score_bar(tracker.correct, tracker.total, tracker.points, tracker.streak)
 
-        if i < len(selected):
+        if i < total:
             get_input("Press ENTER for next question...")
 
     # Final results
@@ -216,23 +263,28 @@ def play_quiz(timed: bool = False):
     # Save score
     name = get_input("Enter your name for the leaderboard:")
     if name.strip():
-        save_high_score(name.strip(), tracker.correct, tracker.total, cat_label,
-                        tracker.points, tracker.best_streak)
-        save_game_history(name.strip(), tracker.correct, tracker.total, cat_label,
-                          tracker.points, tracker.best_streak)
+        save_game(name.strip(), tracker.correct, tracker.total, cat_label,
+                  tracker.points, tracker.best_streak)
         _print(f"\n    {GREEN}{BOLD}Score saved to leaderboard!{RESET}\n")
+        flush()
         time.sleep(1)
 
 
 def play_challenge():
     """Run a challenge mode session: 3 lives, questions until you're out."""
+    from questions import (
+        load_questions, get_categories, filter_questions, pick_questions,
+        questions_loaded
+    )
+
     clear_screen()
-    print_loading("Loading challenge", 0.5)
+    if not questions_loaded():
+        print_loading("Loading challenge", 0.5)
 
-    questions = load_questions()
+    bank = load_questions()
 
     # Choose category
-    categories = get_categories(questions)
+    categories = get_categories(bank)
     print_header("CHALLENGE MODE - SELECT CATEGORY")
     all_options = ["All Categories"] + categories
     print_menu(all_options)
@@ -240,14 +292,15 @@ def play_challenge():
     category = None if cat_idx == 1 else categories[cat_idx - 2]
 
     # Get all questions for the category across all difficulties
-    pool = filter_questions(questions, category)
+    pool = filter_questions(bank, category)
     if not pool:
         _print(f"\n    {RED}No questions available. Try again.{RESET}\n")
+        flush()
         time.sleep(1.5)
         return
 
-    import random
-    random.shuffle(pool)
+    # Picking the full pool shuffles it in the same pass
+    pool = pick_questions(pool, len(pool))
 
     lives = 3
     tracker = ScoreTracker()
@@ -260,39 +313,42 @@ def play_challenge():
     _print(f"    {BOLD}Questions:{RESET} {GREEN}{len(pool)} available{RESET}")
     print_countdown(3)
 
+    total = len(pool)
+    record = tracker.record
     for i, q in enumerate(pool, 1):
         clear_screen()
         print_lives(lives)
-        print_question_box(i, len(pool), q.text, q.difficulty)
+        print_question_box(i, total, q.text, q.difficulty)
         print_choices(q.choices)
 
         choice_idx = get_choice("Your answer:", len(q.choices)) - 1
         correct = q.check(choice_idx)
-        details = tracker.record(correct, q.difficulty)
-
-        if correct:
-            print_correct()
-            bonus_parts = []
-            if details["difficulty_bonus"]:
-                bonus_parts.append(f"difficulty +{details['difficulty_bonus']}")
-            if details["streak_bonus"]:
-                bonus_parts.append(f"streak x{tracker.streak} +{details['streak_bonus']}")
-            bonus_str = f" ({', '.join(bonus_parts)})" if bonus_parts else ""
-            _print(f"    {GREEN}{BOLD}+{details['points_earned']} points{bonus_str}{RESET}")
-        else:
-            lives -= 1
-            print_wrong(q.correct_answer)
-            if lives > 0:
-                _print(f"    {RED}You lost a life! {lives} remaining.{RESET}")
+        details = record(correct, q.difficulty)
+
+        with ScreenBuffer():
+            if correct:
+                print_correct()
+                bonus_parts = []
+                if details["difficulty_bonus"]:
+                    bonus_parts.append(f"difficulty +{details['difficulty_bonus']}")
+                if details["streak_bonus"]:
+                    bonus_parts.append(f"streak x{tracker.streak} +{details['streak_bonus']}")
+                bonus_str = f" ({', '.join(bonus_parts)})" if bonus_parts else ""
+                _print(_POINTS_TMPL.format(pts=details['points_earned'], bonus=bonus_str))
             else:
-                _print(f"    {RED}{BOLD}No lives remaining!{RESET}")
+                lives -= 1
+                print_wrong(q.correct_answer)
+                if lives > 0:
+                    _print(f"    {RED}You lost a life! {lives} remaining.{RESET}")
+                else:
+                    _print(f"    {RED}{BOLD}No lives remaining!{RESET}")
 
-        print_score_bar(tracker.correct, tracker.total, tracker.points, tracker.streak)
+            print_score_bar(tracker.correct, tracker.total, tracker.points, tracker.streak)
 
         if lives <= 0:
             break
 
-        if i < len(pool):
+        if i < total:
             get_input("Press ENTER for next question...")
 
     # Show results
@@ -301,11 +357,10 @@ def play_challenge():
 
     name = get_input("Enter your name for the leaderboard:")
     if name.strip():
-        save_high_score(name.strip(), tracker.correct, tracker.total, cat_label,
-                        tracker.points, tracker.best_streak)
-        save_game_history(name.strip(), tracker.correct, tracker.total, cat_label,
-                          tracker.points, tracker.best_streak)
+        save_game(name.strip(), tracker.correct, tracker.total, cat_label,
+                  tracker.points, tracker.best_streak)
         _print(f"\n    {GREEN}{BOLD}Score saved to leaderboard!{RESET}\n")
+        flush()
         time.sleep(1)
 
 
@@ -326,21 +381,16 @@ def show_history():
     else:
         _print(f"    {BOLD}{'#':<4}{'Date':<18}{'Name':<12}{'Score':<10}{'Points':<10}{'Category'}{RESET}")
         _print(f"    {'-' * 68}")
-        # Show most recent games first
-        for i, g in enumerate(reversed(history[-20:]), 1):
+        # Show most recent games first: walk indexes from the tail
+        # instead of slicing a copy and wrapping it in reversed()
+        n = len(history)
+        for i, idx in enumerate(range(n - 1, max(-1, n - 21), -1), 1):
+            g = history[idx]
             pct = g.get('percentage', 0)
-            if pct >= 80:
-                color = GREEN
-            elif pct >= 50:
-                color = YELLOW
-            else:
-                color = RED
-            _print(f"    {DIM}{i:<4}{RESET}"
-                   f"{g.get('date', 'N/A'):<18}"
-                   f"{g['name']:<12}"
-                   f"{color}{g['score']}/{g['total']} ({pct}%){RESET}  "
-                   f"{CYAN}{g.get('points', 0):<10}{RESET}"
-                   f"{g['category']}")
+            color = _PCT_COLORS[(pct >= 50) + (pct >= 80)]
+            _print(_HIST_ROW_FMT % (i, g.get('date', 'N/A'), g['name'],
+                                    color, g['score'], g['total'], pct,
+                                    g.get('points', 0), g['category']))
 
     _print(f"""
 {MAGENTA}{BOLD}
@@ -364,8 +414,10 @@ def show_high_scores():
     if not scores:
         _print(f"    {DIM}No scores yet. Be the first to play!{RESET}")
     else:
-        _print(f"    {BOLD}{'#':<4}{'Name':<15}{'Score':<10}{'Points':<10}{'Streak':<10}{'Category'}{RESET}")
-        _print(f"    {'-' * 63}")
+        lines = [
+            f"    {BOLD}{'#':<4}{'Name':<15}{'Score':<10}{'Points':<10}{'Streak':<10}{'Category'}{RESET}",
+            f"    {'-' * 63}",
+        ]
         for i, s in enumerate(scores, 1):
             medal = ""
             if i == 1:
@@ -375,12 +427,11 @@ def show_high_scores():
             elif i == 3:
                 medal = f"{RED}🥉{RESET}"
 
-            _print(f"    {medal}{CYAN}{i:<4}{RESET}"
-                   f"{s['name']:<15}"
-                   f"{s['score']}/{s['total']:<8}"
-                   f"{YELLOW}{s.get('points', 0):<10}{RESET}"
-                   f"{GREEN}{s.get('best_streak', 0):<10}{RESET}"
-                   f"{s['category']}")
+            lines.append(_SCORE_ROW_FMT % (medal, i, s['name'], s['score'],
+                                           s['total'], s.get('points', 0),
+                                           s.get('best_streak', 0),
+                                           s['category']))
+        _print("\n".join(lines))
 
     _print(f"""
 {YELLOW}{BOLD}
@@ -391,6 +442,15 @@ def show_high_scores():
 
 def main():
     """Main menu loop."""
+    # Line-buffer stdin so pasted multi-line input is handed over line
+    # by line instead of pooling in the text-layer buffer; stdout does
+    # its own buffering in display, so drop line buffering there.
+    try:
+        sys.stdin.reconfigure(line_buffering=True)
+        sys.stdout.reconfigure(line_buffering=False)
+    except (AttributeError, ValueError):
+        pass  # non-standard streams (tests, exotic shells)
+
     banner()
     print_welcome_animation()
     time.sleep(0.5)
@@ -440,9 +500,11 @@ def main():
     ╚═══════════════════════════════════════════════════════╝
 {RESET}
 """)
+            flush()
             break
         else:
             _print(f"\n    {RED}Invalid choice. Please try again.{RESET}")
+            flush()
             time.sleep(1)
 
 
@@ -2,21 +2,32 @@
 
 import json
 import random
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
+try:  # orjson parses the bank several times faster; stdlib works fine too
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 DATA_FILE = Path(__file__).parent / "data" / "questions.json"
 
+_DIFFICULTIES: tuple[str, ...] = ("easy", "medium", "hard")
+
 
+@dataclass(slots=True, frozen=True)
 class Question:
     """Represents a single quiz question."""
 
-    def __init__(self, text: str, choices: list[str], answer: int,
-                 category: str = "General", difficulty: str = "medium"):
-        self.text = text
-        self.choices = choices
-        self.answer = answer          # 0-based index into choices
-        self.category = category
-        self.difficulty = difficulty
+    text: str
+    choices: tuple[str, ...]
+    answer: int                   # 0-based index into choices
+    category: str = "General"
+    difficulty: str = "medium"
 
     @property
     def correct_answer(self) -> str:
@@ -26,47 +37,112 @@ class Question:
         return choice_index == self.answer
 
 
-def load_questions() -> list[Question]:
-    """Load questions from the JSON data file."""
+@dataclass
+class QuestionBank:
+    """The question list plus indexes built once at load time."""
+    questions: list[Question]
+    by_category: dict[str, list[Question]]
+    by_difficulty: dict[str, list[Question]]
+    by_category_difficulty: dict[tuple[str, str], list[Question]]
+    categories: list[str]
+
+
+def _make_question(q: dict) -> Question:
+    """Build a Question from a raw JSON record.
+
+    Interns the repeated category/difficulty strings so every question
+    in e.g. ("Science", "easy") shares one object and filter
+    comparisons hit the identity fast path.
+    """
+    return Question(**{
+        **q,
+        "choices": tuple(q["choices"]),
+        "category": sys.intern(q.get("category", "General")),
+        "difficulty": sys.intern(q.get("difficulty", "medium")),
+    })
+
+
+@lru_cache(maxsize=1)
+def _load_cached(mtime_ns: int) -> QuestionBank:
+    """Parse the data file; keyed by mtime so edits invalidate the cache."""
+    data = _loads(DATA_FILE.read_bytes())
+    # Comprehension with the malformed-entry checks in the filter
+    # clause; no per-record list.append method resolution.
+    questions = [
+        _make_question(q)
+        for q in data["questions"]
+        if q.get("text") and q.get("choices")
+        and 0 <= q.get("answer", -1) < len(q["choices"])
+    ]
+    by_category = defaultdict(list)
+    by_difficulty = defaultdict(list)
+    by_category_difficulty = defaultdict(list)
+    for question in questions:
+        by_category[question.category].append(question)
+        by_difficulty[question.difficulty].append(question)
+        by_category_difficulty[(question.category, question.difficulty)].append(question)
+    return QuestionBank(
+        questions=questions,
+        by_category=dict(by_category),
+        by_difficulty=dict(by_difficulty),
+        by_category_difficulty=dict(by_category_difficulty),
+        categories=sorted(by_category),
+    )
+
+
+def questions_loaded() -> bool:
+    """True once a question bank has been parsed and cached."""
+    return _load_cached.cache_info().currsize > 0
+
+
+def load_questions() -> QuestionBank:
+    """Load the question bank from the JSON data file (cached between calls)."""
     if not DATA_FILE.exists():
         raise FileNotFoundError(
             f"Questions file not found: {DATA_FILE}\n"
             "Make sure data/questions.json exists."
         )
-    with open(DATA_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    questions = []
-    for q in data["questions"]:
-        if not (q.get("text") and q.get("choices") and "answer" in q):
-            continue  # skip malformed entries
-        if not 0 <= q["answer"] < len(q["choices"]):
-            continue
-        questions.append(Question(**q))
-    return questions
-
-
-def get_categories(questions: list[Question]) -> list[str]:
+    return _load_cached(DATA_FILE.stat().st_mtime_ns)
+
+
+def get_categories(bank: QuestionBank) -> list[str]:
     """Return sorted list of unique categories."""
-    return sorted({q.category for q in questions})
+    return bank.categories
 
 
-def get_difficulties() -> list[str]:
-    return ["easy", "medium", "hard"]
+def get_difficulties() -> tuple[str, ...]:
+    return _DIFFICULTIES
 
 
-def filter_questions(questions: list[Question],
+def filter_questions(bank: QuestionBank,
                      category: str | None = None,
                      difficulty: str | None = None) -> list[Question]:
-    """Filter questions by category and/or difficulty."""
-    result = questions
-    if category:
-        result = [q for q in result if q.category == category]
-    if difficulty:
-        result = [q for q in result if q.difficulty == difficulty]
-    return result
+    """Filter questions by category and/or difficulty via the bank indexes.
+
+    Returns a fresh list, so callers are free to shuffle it.
+    """
+    if category and difficulty:
+        result = bank.by_category_difficulty.get((category, difficulty), [])
+    elif category:
+        result = bank.by_category.get(category, [])
+    elif difficulty:
+        result = bank.by_difficulty.get(difficulty, [])
+    else:
+        result = bank.questions
+    return list(result)
 
 
 def pick_questions(questions: list[Question], count: int = 5) -> list[Question]:
-    """Pick a random subset of questions."""
-    count = min(count, len(questions))
-    return random.sample(questions, count)
+    """Pick a random subset of questions.
+
+    Partial Fisher-Yates over an index list: only the first `count`
+    positions are shuffled, so picking the whole pool doubles as a
+    shuffle without the set bookkeeping random.sample does.
+    """
+    n = len(questions)
+    count = min(count, n)
+    idx = list(range(n))
+    for i in range(count):
+        j = random.randrange(i, n)
+        idx[i], idx[j] = idx[j], idx[i]
+    return [questions[k] for k in idx[:count]]
@@ -1,14 +1,99 @@
 """Score tracking and high score leaderboard."""
 
 import json
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 
-SCORES_FILE = Path(__file__).parent / "data" / "scores.json"
-HISTORY_FILE = Path(__file__).parent / "data" / "history.json"
+try:  # orjson decodes several times faster; stdlib works fine too
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+DB_FILE = Path(__file__).parent / "data" / "quiz.db"
+
+# Pre-SQLite save files, imported into the database on first run.
+# History lived in history.json (array) before the JSON Lines switch,
+# then history.jsonl; scores.json only ever held a top-10 snapshot.
+_LEGACY_SCORES = Path(__file__).parent / "data" / "scores.json"
+_LEGACY_HISTORY = Path(__file__).parent / "data" / "history.jsonl"
+_LEGACY_HISTORY_JSON = Path(__file__).parent / "data" / "history.json"
 
 DIFFICULTY_MULTIPLIER = {"easy": 1, "medium": 2, "hard": 3}
 
+# Per-answer bonus tables.  The streak bonus caps at +25, so index with
+# min(streak, 6) instead of recomputing min(streak - 1, 5) * 5; the
+# difficulty bonus folds the base-10 multiplier arithmetic into one
+# lookup.
+_STREAK_BONUS = (0, 0, 5, 10, 15, 20, 25)
+_DIFF_BONUS = {"easy": 0, "medium": 10, "hard": 20}
+
+# Column order of the games table; save_game builds its row against
+# this and the query helpers zip fetched rows back into dicts.
+_SCHEMA = ("name", "score", "total", "percentage", "points",
+           "best_streak", "category", "date")
+
+_COLS = ", ".join(_SCHEMA)
+_INSERT = f"INSERT INTO games ({_COLS}) VALUES ({', '.join('?' * len(_SCHEMA))})"
+
+_conn: sqlite3.Connection | None = None
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the save database, initializing it on first use."""
+    global _conn
+    if _conn is None:
+        DB_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _conn = sqlite3.connect(DB_FILE)
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS games ("
+            "name TEXT, score INTEGER, total INTEGER, percentage REAL, "
+            "points INTEGER, best_streak INTEGER, category TEXT, date TEXT)")
+        _conn.execute(
+            "CREATE INDEX IF NOT EXISTS games_rank "
+            "ON games (points DESC, percentage DESC)")
+        _migrate_legacy(_conn)
+    return _conn
+
+
+def _migrate_legacy(conn: sqlite3.Connection):
+    """One-time import of the old JSON save files into the database.
+
+    The history logs held every game and scores.json only a top-10
+    snapshot of the same games, so the scores file is imported only
+    when no history log (jsonl or the older json array) exists.
+    Imported files are kept around with a .bak suffix.
+    """
+    records = []
+    if _LEGACY_HISTORY.exists():
+        with open(_LEGACY_HISTORY, "rb") as f:
+            records = [_loads(line) for line in f if line.strip()]
+    elif _LEGACY_HISTORY_JSON.exists():
+        records = _loads(_LEGACY_HISTORY_JSON.read_bytes())
+    elif _LEGACY_SCORES.exists():
+        records = _loads(_LEGACY_SCORES.read_bytes())
+    if records:
+        with conn:
+            conn.executemany(_INSERT, [
+                tuple(r.get(k, 0) for k in _SCHEMA) for r in records])
+    for path in (_LEGACY_HISTORY, _LEGACY_HISTORY_JSON, _LEGACY_SCORES):
+        if path.exists():
+            path.rename(path.with_suffix(path.suffix + ".bak"))
+
+
+def _compute_points(difficulty: str, streak: int) -> tuple[int, int, int]:
+    """Table-lookup scoring for one correct answer.
+
+    Returns (difficulty_bonus, streak_bonus, points_earned).
+    """
+    try:  # direct lookup beats .get: the difficulty is almost always known
+        diff_bonus = _DIFF_BONUS[difficulty]
+    except KeyError:
+        diff_bonus = 0
+    streak_bonus = _STREAK_BONUS[streak if streak < 7 else 6]
+    return diff_bonus, streak_bonus, 10 + diff_bonus + streak_bonus
+
 
 class ScoreTracker:
     """Tracks score during a single game session with streak bonuses."""
@@ -19,6 +104,7 @@ class ScoreTracker:
         self.points = 0
         self.streak = 0
         self.best_streak = 0
+        self.percentage = 0.0
 
     def record(self, is_correct: bool, difficulty: str = "medium") -> dict:
         """Record an answer and return scoring details."""
@@ -28,15 +114,9 @@ class ScoreTracker:
         if is_correct:
             self.correct += 1
             self.streak += 1
-            if self.streak > self.best_streak:
-                self.best_streak = self.streak
+            self.best_streak = max(self.best_streak, self.streak)
 
-            base = 10
-            diff_mult = DIFFICULTY_MULTIPLIER.get(difficulty, 1)
-            diff_bonus = base * (diff_mult - 1)
-            streak_bonus = min(self.streak - 1, 5) * 5  # max +25 streak bonus
-
-            earned = base + diff_bonus + streak_bonus
+            diff_bonus, streak_bonus, earned = _compute_points(difficulty, self.streak)
             self.points += earned
 
             details["difficulty_bonus"] = diff_bonus
@@ -45,72 +125,69 @@ class ScoreTracker:
         else:
             self.streak = 0
 
+        # Plain attribute refreshed here instead of a property: record
+        # is the only mutator, and the UI reads percentage far more
+        # often than it changes.
+        self.percentage = (self.correct / self.total) * 100
+
         return details
 
-    @property
-    def percentage(self) -> float:
-        if self.total == 0:
-            return 0.0
-        return (self.correct / self.total) * 100
 
+def save_game(name: str, score: int, total: int, category: str,
+              points: int = 0, best_streak: int = 0):
+    """Record a finished game; leaderboard and history both query this."""
+    row = (name, score, total,
+           round((score / total) * 100, 1) if total else 0,
+           points, best_streak, category,
+           datetime.now().isoformat(sep=" ", timespec="minutes"))
+    conn = _connect()
+    with conn:
+        conn.execute(_INSERT, row)
 
-def load_high_scores() -> list[dict]:
-    """Load high scores from file."""
-    if not SCORES_FILE.exists():
-        return []
-    with open(SCORES_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def save_high_score(name: str, score: int, total: int, category: str,
-                    points: int = 0, best_streak: int = 0):
-    """Save a new high score entry."""
-    scores = load_high_scores()
-    scores.append({
-        "name": name,
-        "score": score,
-        "total": total,
-        "percentage": round((score / total) * 100, 1) if total else 0,
-        "points": points,
-        "best_streak": best_streak,
-        "category": category,
-        "date": datetime.now().strftime("%Y-%m-%d %H:%M"),
-    })
-    # Keep top 10 by points (then percentage as tiebreaker)
-    scores.sort(key=lambda s: (s.get("points", 0), s["percentage"]), reverse=True)
-    scores = scores[:10]
-    SCORES_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(SCORES_FILE, "w", encoding="utf-8") as f:
-        json.dump(scores, f, indent=2)
+
+def _rows_to_dicts(rows: list[tuple]) -> list[dict]:
+    return [dict(zip(_SCHEMA, row)) for row in rows]
 
 
 def get_top_scores(n: int = 5) -> list[dict]:
-    """Return top n scores."""
-    return load_high_scores()[:n]
-
-
-def save_game_history(name: str, score: int, total: int, category: str,
-                      points: int = 0, best_streak: int = 0):
-    """Save a game to the history log (keeps all games)."""
-    history = load_game_history()
-    history.append({
-        "name": name,
-        "score": score,
-        "total": total,
-        "percentage": round((score / total) * 100, 1) if total else 0,
-        "points": points,
-        "best_streak": best_streak,
-        "category": category,
-        "date": datetime.now().strftime("%Y-%m-%d %H:%M"),
-    })
-    HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(HISTORY_FILE, "w", encoding="utf-8") as f:
-        json.dump(history, f, indent=2)
+    """Return the top n games by points (percentage breaks ties)."""
+    rows = _connect().execute(
+        f"SELECT {_COLS} FROM games "
+        "ORDER BY points DESC, percentage DESC, rowid LIMIT ?", (n,)).fetchall()
+    return _rows_to_dicts(rows)
+
+
+def load_high_scores() -> list[dict]:
+    """Return the top-10 leaderboard."""
+    return get_top_scores(10)
 
 
 def load_game_history() -> list[dict]:
-    """Load full game history from file."""
-    if not HISTORY_FILE.exists():
-        return []
-    with open(HISTORY_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """Return every recorded game, oldest first."""
+    rows = _connect().execute(
+        f"SELECT {_COLS} FROM games ORDER BY rowid").fetchall()
+    return _rows_to_dicts(rows)
+
+
+class HistoryWriter:
+    """Inserts a batch of game records in a single transaction.
+
+    save_game commits (and the database syncs) once per call; for batch
+    writes (imports, back-to-back games) group them::
+
+        with HistoryWriter() as log:
+            log.append(record)
+    """
+
+    def __enter__(self):
+        self._conn = _connect()
+        return self
+
+    def append(self, record: dict):
+        self._conn.execute(_INSERT, tuple(record[k] for k in _SCHEMA))
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self._conn.commit()
+        else:
+            self._conn.rollback()